@@ -4,174 +4,328 @@ import yfinance as yf
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
+from numba import njit
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from operator import itemgetter
+from pathlib import Path
+CACHE_DIR = Path(".cache")
+# Time-to-live (seconds) for each cached Yahoo endpoint
+INFO_TTL = 60 * 60  # currentPrice moves intraday
+HISTORY_TTL = 24 * 60 * 60
+class FileCache:
+    """Pickle-backed on-disk cache with a per-lookup time-to-live"""
+    def __init__(self, root=CACHE_DIR):
+        self.root = Path(root)
+    def _path(self, key):
+        digest = hashlib.md5(repr(key).encode()).hexdigest()
+        return self.root / f"{digest}.pkl"
+    def get(self, key, ttl):
+        """Return the cached value for key if younger than ttl, else None"""
+        try:
+            with open(self._path(key), 'rb') as f:
+                entry = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+        if time.time() - entry['ts'] < ttl:
+            return entry['data']
+        return None
+    def fetch(self, key, fetch_fn):
+        """Call fetch_fn and store its result under key"""
+        data = fetch_fn()
+        # Don't pin a failed/empty Yahoo response for the whole TTL
+        empty = data.empty if isinstance(data, pd.DataFrame) else not data
+        if empty:
+            return data
+        self.root.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename so readers never see a partial pickle
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump({'ts': time.time(), 'data': data}, f)
+        os.replace(tmp, self._path(key))
+        return data
+_cache = FileCache()
+# Explicit signature compiles the kernel at import (loaded from the on-disk
+# cache after the first run) instead of on the first Analyze click
+@njit('UniTuple(float32[::1], 5)(float32[::1])', cache=True, fastmath=True, nogil=True)
+def _compute_indicators(close):
+    """MA50, MA200, 14-day RSI, MACD and its signal line in one pass over close"""
+    n = close.shape[0]
+    # Outputs are float32 (plenty for display), running state stays float64 so
+    # the window sums and EWMAs don't drift
+    ma50 = np.full(n, np.nan, dtype=np.float32)
+    ma200 = np.full(n, np.nan, dtype=np.float32)
+    rsi = np.full(n, np.nan, dtype=np.float32)
+    macd = np.empty(n, dtype=np.float32)
+    signal = np.empty(n, dtype=np.float32)
+    if n == 0:
+        return ma50, ma200, rsi, macd, signal
+    # Indicators whose window is longer than the series are left all-NaN
+    has_ma50 = n >= 50
+    has_ma200 = n >= 200
+    has_rsi = n > 14
+    # EWMA smoothing factors, 2 / (span + 1)
+    a12, a26, a9 = 2 / 13, 2 / 27, 2 / 10
+    sum50 = sum200 = 0.0
+    avg_gain = avg_loss = 0.0
+    e1 = e2 = np.float64(close[0])
+    sig = 0.0
+    for i in range(n):
+        c = np.float64(close[i])
+        # Moving averages from running window sums
+        if has_ma50:
+            sum50 += c
+            if i >= 50:
+                sum50 -= close[i - 50]
+            if i >= 49:
+                ma50[i] = sum50 / 50
+        if has_ma200:
+            sum200 += c
+            if i >= 200:
+                sum200 -= close[i - 200]
+            if i >= 199:
+                ma200[i] = sum200 / 200
+        # RSI with Wilder smoothing, avg_t = (13 * avg_{t-1} + x_t) / 14, seeded
+        # with the plain mean gain/loss of the first 14 changes
+        if has_rsi and i >= 1:
+            d = c - close[i - 1]
+            gain = max(d, 0.0)
+            loss = max(-d, 0.0)
+            if i <= 14:
+                avg_gain += gain / 14
+                avg_loss += loss / 14
+            else:
+                avg_gain = (avg_gain * 13 + gain) / 14
+                avg_loss = (avg_loss * 13 + loss) / 14
+            if i >= 14:
+                if avg_loss > 0:
+                    rsi[i] = 100 - 100 / (1 + avg_gain / avg_loss)
+                elif avg_gain > 0:
+                    rsi[i] = 100.0
+        # MACD (pandas ewm with adjust=False)
+        if i >= 1:
+            e1 = a12 * c + (1 - a12) * e1
+            e2 = a26 * c + (1 - a26) * e2
+            sig = a9 * (e1 - e2) + (1 - a9) * sig
+        macd[i] = e1 - e2
+        signal[i] = sig
+    return ma50, ma200, rsi, macd, signal
 def calculate_technical_indicators(hist):
     """Calculate technical indicators"""
-    # Moving averages
-    hist['MA50'] = hist['Close'].rolling(window=50).mean()
-    hist['MA200'] = hist['Close'].rolling(window=200).mean()
-    # RSI
-    delta = hist['Close'].diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-    rs = gain / loss
-    hist['RSI'] = 100 - (100 / (1 + rs))
-    # MACD
-    exp1 = hist['Close'].ewm(span=12, adjust=False).mean()
-    exp2 = hist['Close'].ewm(span=26, adjust=False).mean()
-    hist['MACD'] = exp1 - exp2
-    hist['Signal'] = hist['MACD'].ewm(span=9, adjust=False).mean()
-    return hist
+    # The kernel only needs the raw Close values as one contiguous float32 buffer
+    close = np.ascontiguousarray(hist['Close'].to_numpy(dtype=np.float32))
+    ma50, ma200, rsi, macd, signal = _compute_indicators(close)
+    return hist.assign(MA50=ma50, MA200=ma200, RSI=rsi, MACD=macd, Signal=signal)
+@st.cache_resource(ttl=INFO_TTL)
+def _get_ticker(ticker):
+    """Shared yf.Ticker per symbol; expires with info since Ticker memoizes it"""
+    return yf.Ticker(ticker)
+@st.cache_resource
+def _get_executor():
+    """Thread pool for Yahoo requests, kept alive across Streamlit reruns"""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix='yfinance')
+@st.cache_resource
+def _get_download_lock():
+    """yf.download keeps its results in module-global state, so calls must not overlap"""
+    return threading.Lock()
+def get_price_history(tickers, period="1y"):
+    """Fetch daily OHLC history for several tickers with one batched yf.download"""
+    with _get_download_lock():
+        data = yf.download(tickers, period=period, group_by='ticker', auto_adjust=True,
+                           progress=False, threads=True)
+    if len(tickers) == 1:
+        return {tickers[0]: data}
+    return {ticker: data[ticker.upper()].dropna(how='all') for ticker in tickers}
+def _fetch_all(requests):
+    """Resolve (key, ttl, fetch_fn) requests from the disk cache, fetching misses concurrently"""
+    results = [_cache.get(key, ttl) for key, ttl, _ in requests]
+    futures = {i: _get_executor().submit(_cache.fetch, key, fetch_fn)
+               for i, (key, _, fetch_fn) in enumerate(requests) if results[i] is None}
+    for i, future in futures.items():
+        results[i] = future.result()
+    return results
+@st.cache_data(ttl=INFO_TTL, show_spinner=False)
 def get_stock_data(ticker):
     """Fetch stock data using yfinance"""
-    stock = yf.Ticker(ticker)
-    info = stock.info
-    # Get historical data for the past year
-    hist = stock.history(period="1y")
-    hist = calculate_technical_indicators(hist)
-    # Get financial statements
-    balance_sheet = stock.balance_sheet
-    income_stmt = stock.income_stmt
-    cash_flow = stock.cash_flow
-    return info, hist, balance_sheet, income_stmt, cash_flow
-def calculate_metrics(info, hist, balance_sheet, income_stmt, cash_flow):
-    """Calculate fundamental metrics"""
-    metrics = {}
+    try:
+        stock = _get_ticker(ticker)
+        # Info and a year of price history
+        info, hist = _fetch_all([
+            ((ticker, 'info'), INFO_TTL, lambda: stock.info),
+            ((ticker, 'history', '1y'), HISTORY_TTL, lambda: get_price_history([ticker])[ticker]),
+        ])
+        if hist.empty:
+            raise ValueError(f"No historical data found for {ticker}")
+        hist = calculate_technical_indicators(hist)
+        return info, hist
+    except Exception as e:
+        st.error(f"Error fetching data for {ticker}: {str(e)}")
+        raise e
+# Fundamental metrics as (display name, yfinance info key, scale); missing or
+# None values count as 0
+FIELD_MAP = (
     # Price metrics
-    metrics['Current Price'] = info.get('currentPrice', 0)
-    metrics['52 Week High'] = info.get('fiftyTwoWeekHigh', 0)
-    metrics['52 Week Low'] = info.get('fiftyTwoWeekLow', 0)
-    metrics['Market Cap (B)'] = info.get('marketCap', 0) / 1e9
+    ('Current Price', 'currentPrice', 1),
+    ('52 Week High', 'fiftyTwoWeekHigh', 1),
+    ('52 Week Low', 'fiftyTwoWeekLow', 1),
+    ('Market Cap (B)', 'marketCap', 1e-9),
     # Valuation metrics
-    metrics['P/E Ratio'] = info.get('trailingPE', 0)
-    metrics['Forward P/E'] = info.get('forwardPE', 0)
-    metrics['PEG Ratio'] = info.get('pegRatio', 0)
-    metrics['Price/Book'] = info.get('priceToBook', 0)
-    metrics['Price/Sales'] = info.get('priceToSalesTrailing12Months', 0)
-    metrics['EV/EBITDA'] = info.get('enterpriseToEbitda', 0)
+    ('P/E Ratio', 'trailingPE', 1),
+    ('Forward P/E', 'forwardPE', 1),
+    ('PEG Ratio', 'pegRatio', 1),
+    ('Price/Book', 'priceToBook', 1),
+    ('Price/Sales', 'priceToSalesTrailing12Months', 1),
+    ('EV/EBITDA', 'enterpriseToEbitda', 1),
     # Financial health metrics
-    metrics['Current Ratio'] = info.get('currentRatio', 0)
-    metrics['Debt/Equity'] = info.get('debtToEquity', 0)
-    metrics['Quick Ratio'] = info.get('quickRatio', 0)
+    ('Current Ratio', 'currentRatio', 1),
+    ('Debt/Equity', 'debtToEquity', 1),
+    ('Quick Ratio', 'quickRatio', 1),
     # Profitability metrics
-    metrics['Return on Equity'] = info.get('returnOnEquity', 0)
-    metrics['Return on Assets'] = info.get('returnOnAssets', 0)
-    metrics['Profit Margin'] = info.get('profitMargins', 0)
-    metrics['Operating Margin'] = info.get('operatingMargins', 0)
-    metrics['Gross Margin'] = info.get('grossMargins', 0)
+    ('Return on Equity', 'returnOnEquity', 1),
+    ('Return on Assets', 'returnOnAssets', 1),
+    ('Profit Margin', 'profitMargins', 1),
+    ('Operating Margin', 'operatingMargins', 1),
+    ('Gross Margin', 'grossMargins', 1),
     # Growth metrics
-    metrics['Revenue Growth'] = info.get('revenueGrowth', 0)
-    metrics['Earnings Growth'] = info.get('earningsGrowth', 0)
+    ('Revenue Growth', 'revenueGrowth', 1),
+    ('Earnings Growth', 'earningsGrowth', 1),
     # Dividend metrics
-    metrics['Dividend Yield'] = info.get('dividendYield', 0) if info.get('dividendYield') else 0
-    metrics['Payout Ratio'] = info.get('payoutRatio', 0) if info.get('payoutRatio') else 0
-    return metrics
+    ('Dividend Yield', 'dividendYield', 1),
+    ('Payout Ratio', 'payoutRatio', 1),
+)
+def calculate_metrics(info, hist):
+    """Calculate fundamental metrics"""
+    return {name: (info.get(key) or 0) * scale for name, key, scale in FIELD_MAP}
+# Scoring criteria as (reason, ((metric, lower, upper), ...)); a criterion earns
+# a point when every listed metric lies strictly between its bounds
+CRITERIA = (
+    # Valuation
+    ("P/E ratio is reasonable (< 25)", (('P/E Ratio', 0, 25),)),
+    ("PEG ratio indicates good value (< 1.5)", (('PEG Ratio', 0, 1.5),)),
+    ("Price/Book ratio is attractive (< 3)", (('Price/Book', 0, 3),)),
+    ("EV/EBITDA indicates reasonable valuation (< 15)", (('EV/EBITDA', 0, 15),)),
+    # Financial health
+    ("Strong current ratio (> 1.5)", (('Current Ratio', 1.5, np.inf),)),
+    ("Low debt-to-equity ratio (< 1)", (('Debt/Equity', -np.inf, 1),)),
+    # Profitability
+    ("Strong Return on Equity (> 15%)", (('Return on Equity', 0.15, np.inf),)),
+    ("Good Return on Assets (> 7%)", (('Return on Assets', 0.07, np.inf),)),
+    ("Healthy operating margin (> 15%)", (('Operating Margin', 0.15, np.inf),)),
+    # Growth
+    ("Strong revenue growth (> 10%)", (('Revenue Growth', 0.1, np.inf),)),
+    ("Strong earnings growth (> 10%)", (('Earnings Growth', 0.1, np.inf),)),
+    # Dividend
+    ("Sustainable dividend with good yield (> 2%)",
+     (('Dividend Yield', 0.02, np.inf), ('Payout Ratio', -np.inf, 0.75))),
+)
+# Red flags as (metric, lower, upper, concern), same strict bounds
+CONCERNS = (
+    ('P/E Ratio', 35, np.inf, "High P/E ratio indicates potential overvaluation"),
+    ('Current Ratio', -np.inf, 1, "Low current ratio indicates potential liquidity issues"),
+    ('Debt/Equity', 2, np.inf, "High debt levels relative to equity"),
+)
+_CRITERIA_BOUNDS = [bound for _, bounds in CRITERIA for bound in bounds]
+_CRITERIA_LOWER = np.array([lower for _, lower, _ in _CRITERIA_BOUNDS], dtype=float)
+_CRITERIA_UPPER = np.array([upper for _, _, upper in _CRITERIA_BOUNDS], dtype=float)
+# Offset of each criterion's first bound, for np.logical_and.reduceat
+_CRITERIA_STARTS = np.cumsum([0] + [len(bounds) for _, bounds in CRITERIA[:-1]])
+_CONCERN_LOWER = np.array([lower for _, lower, _, _ in CONCERNS], dtype=float)
+_CONCERN_UPPER = np.array([upper for _, _, upper, _ in CONCERNS], dtype=float)
+# Every metric the evaluation reads, fetched from the dict in one batched lookup;
+# the index arrays map criteria/concern bounds onto that shared value vector
+_EVAL_KEYS = list(dict.fromkeys([key for key, _, _ in _CRITERIA_BOUNDS]
+                                + [key for key, _, _, _ in CONCERNS]))
+_eval_values = itemgetter(*_EVAL_KEYS)
+_CRITERIA_IDX = np.array([_EVAL_KEYS.index(key) for key, _, _ in _CRITERIA_BOUNDS])
+_CONCERN_IDX = np.array([_EVAL_KEYS.index(key) for key, _, _, _ in CONCERNS])
 def evaluate_stock(metrics):
     """Evaluate stock based on fundamental metrics"""
-    score = 0
-    max_score = 12
-    reasons = []
-    concerns = []
-    # Valuation criteria
-    if 0 < metrics['P/E Ratio'] < 25:
-        score += 1
-        reasons.append("P/E ratio is reasonable (< 25)")
-    elif metrics['P/E Ratio'] > 35:
-        concerns.append("High P/E ratio indicates potential overvaluation")
-    if 0 < metrics['PEG Ratio'] < 1.5:
-        score += 1
-        reasons.append("PEG ratio indicates good value (< 1.5)")
-    if 0 < metrics['Price/Book'] < 3:
-        score += 1
-        reasons.append("Price/Book ratio is attractive (< 3)")
-    if 0 < metrics['EV/EBITDA'] < 15:
-        score += 1
-        reasons.append("EV/EBITDA indicates reasonable valuation (< 15)")
-    # Financial health criteria
-    if metrics['Current Ratio'] > 1.5:
-        score += 1
-        reasons.append("Strong current ratio (> 1.5)")
-    elif metrics['Current Ratio'] < 1:
-        concerns.append("Low current ratio indicates potential liquidity issues")
-    if metrics['Debt/Equity'] < 1:
-        score += 1
-        reasons.append("Low debt-to-equity ratio (< 1)")
-    elif metrics['Debt/Equity'] > 2:
-        concerns.append("High debt levels relative to equity")
-    # Profitability criteria
-    if metrics['Return on Equity'] > 0.15:
-        score += 1
-        reasons.append("Strong Return on Equity (> 15%)")
-    if metrics['Return on Assets'] > 0.07:
-        score += 1
-        reasons.append("Good Return on Assets (> 7%)")
-    if metrics['Operating Margin'] > 0.15:
-        score += 1
-        reasons.append("Healthy operating margin (> 15%)")
-    # Growth criteria
-    if metrics['Revenue Growth'] > 0.1:
-        score += 1
-        reasons.append("Strong revenue growth (> 10%)")
-    if metrics['Earnings Growth'] > 0.1:
-        score += 1
-        reasons.append("Strong earnings growth (> 10%)")
-    # Dividend criteria
-    if metrics['Dividend Yield'] > 0.02 and metrics['Payout Ratio'] < 0.75:
-        score += 1
-        reasons.append("Sustainable dividend with good yield (> 2%)")
+    max_score = len(CRITERIA)
+    values = np.array(_eval_values(metrics), dtype=float)
+    criteria_values = values[_CRITERIA_IDX]
+    in_bounds = (criteria_values > _CRITERIA_LOWER) & (criteria_values < _CRITERIA_UPPER)
+    passed = np.logical_and.reduceat(in_bounds, _CRITERIA_STARTS)
+    score = int(passed.sum())
+    reasons = [CRITERIA[i][0] for i in np.flatnonzero(passed)]
+    concern_values = values[_CONCERN_IDX]
+    flagged = (concern_values > _CONCERN_LOWER) & (concern_values < _CONCERN_UPPER)
+    concerns = [CONCERNS[i][3] for i in np.flatnonzero(flagged)]
     return score, max_score, reasons, concerns
-def plot_technical_analysis(hist):
-    """Create technical analysis charts"""
+# How each plotted column is aggregated when hist is downsampled for display
+DISPLAY_AGG = {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last',
+               'MA50': 'last', 'MA200': 'last', 'RSI': 'last', 'MACD': 'last', 'Signal': 'last'}
+def plot_technical_analysis(hist, freq='W'):
+    """Create technical analysis charts, with bars resampled to freq (None keeps daily)"""
+    if freq is not None:
+        hist = hist.resample(freq).agg(DISPLAY_AGG).dropna(subset=['Close'])
     # Create figure with secondary y-axis
     fig = make_subplots(rows=3, cols=1,
                         shared_xaxes=True,  # Changed from shared_xaxis
                         vertical_spacing=0.05,
                         row_heights=[0.6, 0.2, 0.2],
                         subplot_titles=('Price', 'RSI', 'MACD'))
-    # Candlestick chart with MA
-    fig.add_trace(go.Candlestick(
-        x=hist.index,
-        open=hist['Open'],
-        high=hist['High'],
-        low=hist['Low'],
-        close=hist['Close'],
-        name='Price'
-    ), row=1, col=1)
-    fig.add_trace(go.Scatter(
-        x=hist.index,
-        y=hist['MA50'],
-        name='50-day MA',
-        line=dict(color='orange')
-    ), row=1, col=1)
-    fig.add_trace(go.Scatter(
-        x=hist.index,
-        y=hist['MA200'],
-        name='200-day MA',
-        line=dict(color='blue')
-    ), row=1, col=1)
-    # RSI
-    fig.add_trace(go.Scatter(
-        x=hist.index,
-        y=hist['RSI'],
-        name='RSI',
-        line=dict(color='purple')
-    ), row=2, col=1)
+    # Bars are daily or coarser, so send bare exchange-local dates rather than
+    # making Plotly convert the tz-aware pandas index to full timestamps
+    x = hist.index.tz_localize(None).values.astype('datetime64[D]')
+    # Pull every plotted column out of the frame once as a NumPy array
+    ma50, ma200, rsi, macd, signal = (hist[col].to_numpy()
+                                      for col in ('MA50', 'MA200', 'RSI', 'MACD', 'Signal'))
+    ma50_valid = ~np.isnan(ma50)
+    ma200_valid = ~np.isnan(ma200)
+    rsi_valid = ~np.isnan(rsi)
+    # Candlestick chart with MA; indicator traces skip their NaN warm-up rows
+    traces = [
+        go.Candlestick(
+            x=x,
+            open=hist['Open'].to_numpy(),
+            high=hist['High'].to_numpy(),
+            low=hist['Low'].to_numpy(),
+            close=hist['Close'].to_numpy(),
+            name='Price'
+        ),
+        go.Scatter(
+            x=x[ma50_valid],
+            y=ma50[ma50_valid],
+            name='50-day MA',
+            line=dict(color='orange')
+        ),
+        go.Scatter(
+            x=x[ma200_valid],
+            y=ma200[ma200_valid],
+            name='200-day MA',
+            line=dict(color='blue')
+        ),
+        # RSI
+        go.Scatter(
+            x=x[rsi_valid],
+            y=rsi[rsi_valid],
+            name='RSI',
+            line=dict(color='purple')
+        ),
+        # MACD
+        go.Scatter(
+            x=x,
+            y=macd,
+            name='MACD',
+            line=dict(color='blue')
+        ),
+        go.Scatter(
+            x=x,
+            y=signal,
+            name='Signal',
+            line=dict(color='orange')
+        ),
+    ]
+    fig.add_traces(traces, rows=[1, 1, 1, 2, 3, 3], cols=[1] * len(traces))
     # Add RSI levels
     fig.add_hline(y=70, line_dash="dash", line_color="red", row=2, col=1)
     fig.add_hline(y=30, line_dash="dash", line_color="green", row=2, col=1)
-    # MACD
-    fig.add_trace(go.Scatter(
-        x=hist.index,
-        y=hist['MACD'],
-        name='MACD',
-        line=dict(color='blue')
-    ), row=3, col=1)
-    fig.add_trace(go.Scatter(
-        x=hist.index,
-        y=hist['Signal'],
-        name='Signal',
-        line=dict(color='orange')
-    ), row=3, col=1)
     # Update layout
     fig.update_layout(
         height=800,
@@ -184,56 +338,19 @@ def plot_technical_analysis(hist):
     fig.update_yaxes(title_text="RSI", row=2, col=1)
     fig.update_yaxes(title_text="MACD", row=3, col=1)
     return fig
-def calculate_technical_indicators(hist):
-    """Calculate technical indicators"""
-    # Moving averages
-    hist['MA50'] = hist['Close'].rolling(window=50).mean()
-    hist['MA200'] = hist['Close'].rolling(window=200).mean()
-    # RSI
-    delta = hist['Close'].diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-    rs = gain / loss
-    hist['RSI'] = 100 - (100 / (1 + rs))
-    # MACD
-    exp1 = hist['Close'].ewm(span=12, adjust=False).mean()
-    exp2 = hist['Close'].ewm(span=26, adjust=False).mean()
-    hist['MACD'] = exp1 - exp2
-    hist['Signal'] = hist['MACD'].ewm(span=9, adjust=False).mean()
-    # Fill NaN values
-    hist = hist.fillna(method='bfill')
-    return hist
-def get_stock_data(ticker):
-    """Fetch stock data using yfinance"""
-    try:
-        stock = yf.Ticker(ticker)
-        info = stock.info
-        # Get historical data for the past year
-        hist = stock.history(period="1y")
-        if hist.empty:
-            raise ValueError(f"No historical data found for {ticker}")
-        hist = calculate_technical_indicators(hist)
-        # Get financial statements
-        balance_sheet = stock.balance_sheet
-        income_stmt = stock.income_stmt
-        cash_flow = stock.cash_flow
-        return info, hist, balance_sheet, income_stmt, cash_flow
-    except Exception as e:
-        st.error(f"Error fetching data for {ticker}: {str(e)}")
-        raise e
-# [Rest of the code remains the same]
 def main():
     st.set_page_config(layout="wide")
     st.title("Advanced Stock Analysis Dashboard")
     st.write("Enter a stock ticker to analyze its fundamentals and technical indicators")
     # User input
     ticker = st.text_input("Stock Ticker", "AAPL").upper()
+    resolution = st.radio("Chart resolution", ("Weekly", "Daily"), horizontal=True)
     if st.button("Analyze"):
         try:
             with st.spinner('Fetching data...'):
                 # Get stock data
-                info, hist, balance_sheet, income_stmt, cash_flow = get_stock_data(ticker)
-                metrics = calculate_metrics(info, hist, balance_sheet, income_stmt, cash_flow)
+                info, hist = get_stock_data(ticker)
+                metrics = calculate_metrics(info, hist)
                 # Company info
                 col1, col2 = st.columns([2, 1])
                 with col1:
@@ -243,7 +360,8 @@ def main():
                     st.metric("Current Price", f"${metrics['Current Price']:.2f}")
                     st.metric("Market Cap", f"${metrics['Market Cap (B)']:.2f}B")
                 # Technical Analysis
-                st.plotly_chart(plot_technical_analysis(hist), use_container_width=True)
+                freq = 'W' if resolution == "Weekly" else None
+                st.plotly_chart(plot_technical_analysis(hist, freq), use_container_width=True)
                 # [Rest of the display code remains the same]
         except Exception as e:
             st.error(f"Error analyzing {ticker}. Please try again.")